@@ -0,0 +1,18 @@
+"""
+Data processing for Civica Calgary Zoning Simulation
+
+All geospatial I/O in this package goes through pyogrio; geopandas is
+configured to use it as the default engine when the package is imported.
+"""
+
+try:
+    import pyogrio  # noqa: F401
+except ImportError as e:
+    raise ImportError(
+        "src.data_processing requires pyogrio; install it with "
+        "`pip install -r requirements.txt`"
+    ) from e
+
+import geopandas
+
+geopandas.options.io_engine = "pyogrio"
@@ -7,40 +7,189 @@ ensuring data is in the correct coordinate system and efficiently cached.
 """
 
 import geopandas as gpd
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pyogrio
+import requests
+import shapely
+from pyproj import CRS, Transformer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 import datetime
-from typing import Optional
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 
+__all__ = ["DataManager"]
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (minx, miny, maxx, maxy) in the target CRS
+BBox = Tuple[float, float, float, float]
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all portal requests.
+    
+    The session keeps connections alive across requests (and across the
+    parallel page fetches), asks for compressed responses and retries
+    transient failures with backoff.
+    
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "civica-etl/1.0",
+    })
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _max_rows_from_env() -> Optional[int]:
+    """
+    Read the development row limit from the CIVICA_MAX_ROWS environment variable.
+    
+    Returns:
+        Optional[int]: The row limit, or None if the variable is unset or empty
+        
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    value = os.environ.get("CIVICA_MAX_ROWS")
+    if not value:
+        return None
+    error = ValueError(f"CIVICA_MAX_ROWS must be a positive integer, got {value!r}")
+    try:
+        max_rows = int(value)
+    except ValueError:
+        raise error from None
+    if max_rows < 1:
+        raise error
+    return max_rows
+
+
 class DataManager:
     """Manages data acquisition and caching for Calgary's geospatial data."""
     
     # API endpoints for Calgary's data
-    LAND_USE_DISTRICTS_URL = "https://data.calgary.ca/resource/qe6k-p9nh.geojson?$limit=100000"
-    PARCEL_BOUNDARIES_URL = "https://data.calgary.ca/resource/4bsw-nn7w.geojson"
+    PORTAL_RESOURCE_URL = "https://data.calgary.ca/resource"
+    LAND_USE_DISTRICTS_ID = "qe6k-p9nh"
+    PARCEL_BOUNDARIES_ID = "4bsw-nn7w"
+    LAND_USE_DISTRICTS_URL = f"{PORTAL_RESOURCE_URL}/{LAND_USE_DISTRICTS_ID}.geojson"
+    PARCEL_BOUNDARIES_URL = f"{PORTAL_RESOURCE_URL}/{PARCEL_BOUNDARIES_ID}.geojson"
+    REQUEST_TIMEOUT = 120  # seconds
+    _SESSION = _create_session()
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+    PAGE_SIZE = 100000  # Socrata's maximum limit per request
+    MAX_FETCH_WORKERS = 8
+    DISTRICTS_GEOMETRY_FIELD = "the_geom"
+    
+    # Attribute columns kept from each dataset (the geometry is always kept)
+    ESSENTIAL_DISTRICT_COLS = ["lu_code", "description", "lu_bylaw"]
+    ESSENTIAL_PARCEL_COLS = [
+        "land_size_sm", "property_type", "unique_key", "comm_name",
+        "sub_property_use", "address", "land_use_designation",
+    ]
+    
+    # Low-cardinality parcel columns stored as categoricals
+    CATEGORICAL_PARCEL_COLS = [
+        "property_type", "comm_name", "sub_property_use", "land_use_designation",
+    ]
     
     # Cache configuration
     CACHE_DIR = Path("data/raw")
-    CACHED_DISTRICTS_FILE = CACHE_DIR / "land_use_districts.geojson"
-    CACHED_PARCELS_FILE = CACHE_DIR / "parcel_boundaries.geojson"
-    CACHE_EXPIRY_DAYS = 7
+    CACHED_DISTRICTS_FILE = CACHE_DIR / "land_use_districts.parquet"
+    CACHED_PARCELS_FILE = CACHE_DIR / "parcel_boundaries.parquet"
+    LEGACY_CACHE_SUFFIX = ".geojson"
+    CACHE_ROW_GROUP_SIZE = 50000
+    CACHE_EXPIRY_DAYS = 7  # Fallback when the portal cannot be reached
+    
+    # Last portal update per resource id, looked up once per process
+    _portal_updates: Dict[str, datetime.datetime] = {}
+    
+    # Datasets already loaded by this process, keyed by cache path
+    _loaded: Dict[Path, gpd.GeoDataFrame] = {}
+    
+    # Optional row limit for quick development runs; limited data is never cached
+    MAX_ROWS: Optional[int] = _max_rows_from_env()
     
     # Coordinate reference system (UTM Zone 12N - Calgary's standard)
     TARGET_CRS = "EPSG:3400"
     SOURCE_CRS = "EPSG:4326"  # WGS84
+    
+    # Parsed CRS definitions and transformers into TARGET_CRS, built once each
+    _parsed_crs: Dict[str, CRS] = {}
+    _transformers: Dict[CRS, Transformer] = {}
+    
+    # Reprojection is split across threads (PROJ releases the GIL) once each
+    # thread has at least REPROJECT_CHUNK_SIZE coordinates to work on
+    REPROJECT_WORKERS = os.cpu_count() or 1
+    REPROJECT_CHUNK_SIZE = 250000
+    
+    # pyproj builds a PROJ object per transformer in each thread that uses
+    # it, so the reprojection threads live as long as the cached transformers
+    _REPROJECT_POOL = ThreadPoolExecutor(
+        max_workers=REPROJECT_WORKERS, thread_name_prefix="civica-reproject"
+    )
 
     @classmethod
-    def _is_cache_valid(cls, cache_path: Path) -> bool:
+    def _portal_last_update(cls, resource_id: str) -> datetime.datetime:
         """
-        Check if cached data exists and is not expired.
+        Get the time a dataset was last updated on Calgary's Open Data Portal.
+        
+        The result is remembered for the lifetime of the process.
+        
+        Args:
+            resource_id: Socrata resource id of the dataset
+            
+        Returns:
+            datetime.datetime: Timezone-aware time of the latest record update
+        """
+        if resource_id not in cls._portal_updates:
+            url = f"{cls.PORTAL_RESOURCE_URL}/{resource_id}.json"
+            params = {"$select": "max(:updated_at) AS last_update"}
+            with cls._SESSION.get(url, params=params, timeout=cls.REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+                last_update = datetime.datetime.fromisoformat(
+                    response.json()[0]["last_update"]
+                )
+            # Socrata timestamps are UTC, but may be returned without an offset
+            if last_update.tzinfo is None:
+                last_update = last_update.replace(tzinfo=datetime.timezone.utc)
+            cls._portal_updates[resource_id] = last_update
+        return cls._portal_updates[resource_id]
+
+    @classmethod
+    def _is_cache_valid(cls, cache_path: Path, resource_id: Optional[str] = None) -> bool:
+        """
+        Check if cached data exists and is not stale.
+        
+        When a resource id is given, the cache is valid only if it was written
+        after the dataset's last update on the portal. Without one, or if the
+        portal cannot be reached, the cache expires after CACHE_EXPIRY_DAYS.
         
         Args:
             cache_path: Path to the cached file
+            resource_id: Socrata resource id of the cached dataset
             
         Returns:
             bool: True if cache is valid, False otherwise
@@ -48,85 +197,462 @@ class DataManager:
         if not cache_path.exists():
             return False
             
-        file_age = datetime.datetime.now() - datetime.datetime.fromtimestamp(
-            cache_path.stat().st_mtime
-        )
+        cache_mtime = cache_path.stat().st_mtime
+        if resource_id is not None:
+            try:
+                return cache_mtime > cls._portal_last_update(resource_id).timestamp()
+            except Exception as e:
+                logger.warning(f"Could not check portal for updates to {resource_id}: {e}")
+            
+        file_age = datetime.datetime.now() - datetime.datetime.fromtimestamp(cache_mtime)
         return file_age.days < cls.CACHE_EXPIRY_DAYS
 
     @classmethod
-    def _load_from_cache(cls, cache_path: Path) -> Optional[gpd.GeoDataFrame]:
+    def _migrate_legacy_cache(cls, cache_path: Path) -> None:
+        """
+        Rewrite a GeoJSON cache left by older versions as GeoParquet.
+        
+        The legacy file is read once, saved to cache_path with its original
+        modification time (so expiry is unaffected) and then removed.
+        
+        Args:
+            cache_path: Path to the GeoParquet cache file
+        """
+        legacy_path = cache_path.with_suffix(cls.LEGACY_CACHE_SUFFIX)
+        if cache_path.exists() or not legacy_path.exists():
+            return
+            
+        try:
+            gdf = cls._sort_spatially(gpd.read_file(legacy_path, use_arrow=True))
+            mtime = legacy_path.stat().st_mtime
+            cls._save_to_cache(gdf, cache_path)
+            if cache_path.exists():
+                os.utime(cache_path, (mtime, mtime))
+                legacy_path.unlink()
+                logger.info(f"Migrated legacy cache {legacy_path} to {cache_path}")
+        except Exception as e:
+            logger.warning(f"Error migrating legacy cache {legacy_path}: {e}")
+
+    @classmethod
+    def _geometry_column(cls, cache_path: Path) -> str:
+        """
+        Get the name of the primary geometry column of a GeoParquet file.
+        
+        Only the file footer is read.
+        
+        Args:
+            cache_path: Path to the GeoParquet file
+            
+        Returns:
+            str: Name of the primary geometry column
+        """
+        geo_metadata = json.loads(pq.read_schema(cache_path).metadata[b"geo"])
+        return geo_metadata["primary_column"]
+
+    @classmethod
+    def _load_from_cache(
+        cls,
+        cache_path: Path,
+        resource_id: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        bbox: Optional[BBox] = None,
+    ) -> Optional[gpd.GeoDataFrame]:
         """
         Load data from cache if it exists and is valid.
         
         Args:
             cache_path: Path to the cached file
+            resource_id: Socrata resource id used to check for portal updates
+            columns: Attribute columns to read; all columns if None
+            bbox: Only read features intersecting this box; all features if None
             
         Returns:
             Optional[gpd.GeoDataFrame]: Cached data if valid, None otherwise
         """
-        if not cls._is_cache_valid(cache_path):
+        cls._migrate_legacy_cache(cache_path)
+        if not cls._is_cache_valid(cache_path, resource_id):
             return None
             
         try:
-            gdf = gpd.read_file(str(cache_path))
-            if gdf.crs != cls.TARGET_CRS:
-                gdf = gdf.to_crs(cls.TARGET_CRS)
-            return gdf
+            # Project the stored geometry column explicitly, whatever its name
+            if columns is not None:
+                columns = columns + [cls._geometry_column(cache_path)]
+            gdf = gpd.read_parquet(cache_path, columns=columns, bbox=bbox)
+            if gdf.geometry.name != "geometry":
+                gdf = gdf.rename_geometry("geometry")
+            return cls._ensure_crs(gdf)
         except Exception as e:
             logger.warning(f"Error loading cache from {cache_path}: {e}")
             return None
 
+    @classmethod
+    def _spatial_order(cls, gdf: gpd.GeoDataFrame) -> np.ndarray:
+        """
+        Get the row order that sorts features along a Hilbert curve.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            
+        Returns:
+            np.ndarray: Row positions, with missing and empty geometries last
+        """
+        geoms = np.asarray(gdf.geometry.values)
+        present = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+        distance = np.full(len(gdf), np.iinfo(np.uint64).max, dtype=np.uint64)
+        if present.any():
+            distance[present] = gdf.geometry[present].hilbert_distance().to_numpy()
+        return np.argsort(distance, kind="stable")
+
+    @classmethod
+    def _sort_spatially(cls, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Put features in the order they are stored in the cache.
+        
+        Fresh downloads are sorted the same way before they are returned, so
+        callers see the same rows in the same order whether or not the cache
+        was warm.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            
+        Returns:
+            gpd.GeoDataFrame: gdf in Hilbert order with a new RangeIndex
+        """
+        return gdf.iloc[cls._spatial_order(gdf)].reset_index(drop=True)
+
     @classmethod
     def _save_to_cache(cls, gdf: gpd.GeoDataFrame, cache_path: Path) -> None:
         """
-        Save GeoDataFrame to cache.
+        Save GeoDataFrame to cache as GeoParquet.
+        
+        Rows are written as given, in the Hilbert order of _sort_spatially,
+        in row groups of CACHE_ROW_GROUP_SIZE and with a per-row bounding box
+        column alongside the geometry. Each row group then covers a compact
+        area, so bbox-filtered reads can skip the row groups outside the
+        query window using their statistics.
         
         Args:
-            gdf: GeoDataFrame to cache
+            gdf: GeoDataFrame to cache, as returned by _sort_spatially
             cache_path: Path where to save the cache
         """
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            gdf.to_file(str(cache_path), driver="GeoJSON")
+            gdf.to_parquet(
+                cache_path,
+                compression="zstd",
+                schema_version="1.1.0",
+                write_covering_bbox=True,
+                row_group_size=cls.CACHE_ROW_GROUP_SIZE,
+            )
             logger.info(f"Data cached to {cache_path}")
         except Exception as e:
             logger.error(f"Error saving cache to {cache_path}: {e}")
 
+    @classmethod
+    def _download(cls, url: str) -> bytes:
+        """
+        Download the raw body of a resource.
+        
+        The body is returned as bytes rather than wrapped in a file-like
+        object: pyogrio hands bytes straight to GDAL, while a file-like object
+        would first be read into a second full copy of the payload.
+        
+        Args:
+            url: URL of the resource
+            
+        Returns:
+            bytes: Raw response body
+        """
+        with cls._SESSION.get(url, stream=True, timeout=cls.REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            return b"".join(response.iter_content(chunk_size=cls.DOWNLOAD_CHUNK_SIZE))
+
+    @classmethod
+    def _read_url(cls, url: str, columns: Optional[List[str]] = None) -> gpd.GeoDataFrame:
+        """
+        Download a GeoJSON resource and parse it with pyogrio's Arrow reader.
+        
+        GDAL parses the raw response bytes directly, without a round-trip
+        through a Python string.
+        
+        Args:
+            url: URL of the GeoJSON resource
+            columns: Attribute columns to read; all columns if None
+            
+        Returns:
+            gpd.GeoDataFrame: Parsed features
+        """
+        return pyogrio.read_dataframe(cls._download(url), columns=columns, use_arrow=True)
+
+    @classmethod
+    def _count_records(cls, resource_url: str) -> int:
+        """
+        Ask the Socrata API how many records a resource holds.
+        
+        Args:
+            resource_url: GeoJSON endpoint of the resource
+            
+        Returns:
+            int: Total number of records
+        """
+        count_url = resource_url.replace(".geojson", ".json")
+        params = {"$select": "count(*) AS count"}
+        with cls._SESSION.get(count_url, params=params, timeout=cls.REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            return int(response.json()[0]["count"])
+
+    @classmethod
+    def _fetch_parcel_page(cls, offset: int, limit: int) -> Tuple[dict, pa.Table]:
+        """
+        Fetch a single page of parcel boundaries.
+        
+        Pages are ordered by the Socrata row id so that concurrently fetched
+        offsets neither overlap nor skip records. Only ESSENTIAL_PARCEL_COLS
+        are parsed.
+        
+        Args:
+            offset: Index of the first record in the page
+            limit: Number of records in the page
+            
+        Returns:
+            Tuple[dict, pa.Table]: pyogrio layer metadata, and up to limit
+                parcel records with the geometry as WKB
+        """
+        url = (
+            f"{cls.PARCEL_BOUNDARIES_URL}"
+            f"?$order=:id&$limit={limit}&$offset={offset}"
+        )
+        logger.info(f"Fetching records {offset:,} to {offset + limit:,}...")
+        return pyogrio.read_arrow(cls._download(url), columns=cls.ESSENTIAL_PARCEL_COLS)
+
+    @classmethod
+    def _table_to_geodataframe(cls, meta: dict, table: pa.Table) -> gpd.GeoDataFrame:
+        """
+        Build a GeoDataFrame from a table returned by pyogrio.read_arrow.
+        
+        The geometry column and CRS are taken from the layer metadata rather
+        than from a geoarrow extension tag on the column, which not every
+        pyogrio/GDAL build adds.
+        
+        Args:
+            meta: Layer metadata returned by pyogrio.read_arrow
+            table: Table with the geometry as WKB
+            
+        Returns:
+            gpd.GeoDataFrame: Features with the geometry in a "geometry" column
+        """
+        # pyogrio reports an empty name when the driver does not name the column
+        geometry_name = meta["geometry_name"] or "wkb_geometry"
+        geometry = gpd.GeoSeries.from_wkb(
+            table[geometry_name].to_numpy(), crs=meta["crs"], name="geometry"
+        )
+        attributes = table.drop_columns([geometry_name]).to_pandas()
+        return gpd.GeoDataFrame(attributes, geometry=geometry)
+
+    @classmethod
+    def _parse_crs(cls, crs: str) -> CRS:
+        """
+        Parse a CRS definition such as TARGET_CRS once per process.
+        
+        Comparing a CRS against a string re-parses the string every time;
+        comparing two CRS objects does not.
+        
+        Args:
+            crs: CRS definition, e.g. "EPSG:3400"
+            
+        Returns:
+            CRS: Parsed CRS
+        """
+        if crs not in cls._parsed_crs:
+            cls._parsed_crs[crs] = CRS(crs)
+        return cls._parsed_crs[crs]
+
+    @classmethod
+    def _get_transformer(cls, source_crs: CRS) -> Transformer:
+        """
+        Get a transformer from a source CRS into TARGET_CRS.
+        
+        Building a Transformer is far more expensive than applying one, so
+        each one is created once and reused for the lifetime of the process.
+        
+        Args:
+            source_crs: CRS to transform from
+            
+        Returns:
+            Transformer: always_xy transformer into TARGET_CRS
+        """
+        if source_crs not in cls._transformers:
+            cls._transformers[source_crs] = Transformer.from_crs(
+                source_crs, cls._parse_crs(cls.TARGET_CRS), always_xy=True
+            )
+        return cls._transformers[source_crs]
+
+    @classmethod
+    def _transform_in_place(cls, transformer: Transformer, axes: List[np.ndarray]) -> None:
+        """
+        Transform coordinate arrays in place, in parallel for large inputs.
+        
+        The arrays are cut into contiguous chunks that are transformed by the
+        shared _REPROJECT_POOL using the one (thread-safe) transformer. Each
+        worker thread builds its own PROJ copy of a transformer on first use
+        and keeps it, so later calls skip that setup as on the serial path.
+        
+        Args:
+            transformer: Transformer to apply
+            axes: Contiguous x and y float64 arrays of equal length
+        """
+        n_coords = len(axes[0])
+        n_chunks = min(cls.REPROJECT_WORKERS, n_coords // cls.REPROJECT_CHUNK_SIZE)
+        if n_chunks <= 1:
+            transformer.transform(*axes, inplace=True)
+            return
+            
+        bounds = np.linspace(0, n_coords, n_chunks + 1, dtype=int)
+        
+        def transform_chunk(start: int, stop: int) -> None:
+            transformer.transform(*(axis[start:stop] for axis in axes), inplace=True)
+            
+        list(cls._REPROJECT_POOL.map(transform_chunk, bounds[:-1], bounds[1:]))
+
     @classmethod
     def _ensure_crs(cls, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """
         Ensure GeoDataFrame is in the target coordinate system.
         
+        Data without a CRS is assumed to be in SOURCE_CRS. Data already in the
+        target CRS (such as the cache) is returned unchanged. Otherwise all
+        vertices are reprojected in a single pass over the packed coordinate
+        array rather than geometry by geometry.
+        
         Args:
             gdf: Input GeoDataFrame
             
         Returns:
             gpd.GeoDataFrame: GeoDataFrame in target CRS
         """
-        if gdf.crs != cls.TARGET_CRS:
-            gdf.set_crs(epsg=4326, inplace=True)
-            gdf = gdf.to_crs(cls.TARGET_CRS)
-        return gdf
+        target_crs = cls._parse_crs(cls.TARGET_CRS)
+        if gdf.crs is None:
+            gdf.set_crs(cls._parse_crs(cls.SOURCE_CRS), inplace=True)
+        if target_crs.equals(gdf.crs):
+            return gdf
+            
+        transformer = cls._get_transformer(gdf.crs)
+        geoms = np.asarray(gdf.geometry.values).copy()
+
+        # The target CRS is 2D, so only x/y are transformed. 2D and 3D
+        # geometries are extracted separately: a NaN z on a 2D geometry would
+        # make PROJ return NaN x/y, and writing back x/y alone would drop z.
+        has_z = shapely.has_z(geoms)
+        flat = np.flatnonzero(~has_z)
+        solid = np.flatnonzero(has_z)
+        coords_2d = shapely.get_coordinates(geoms[flat])
+        coords_3d = shapely.get_coordinates(geoms[solid], include_z=True)
+        xy = np.concatenate([coords_2d, coords_3d[:, :2]])
+        axes = [np.ascontiguousarray(xy[:, 0]), np.ascontiguousarray(xy[:, 1])]
+        cls._transform_in_place(transformer, axes)
+
+        n_flat = len(coords_2d)
+        coords_3d[:, 0], coords_3d[:, 1] = axes[0][n_flat:], axes[1][n_flat:]
+        geoms[flat] = shapely.set_coordinates(
+            geoms[flat], np.column_stack([axis[:n_flat] for axis in axes])
+        )
+        geoms[solid] = shapely.set_coordinates(geoms[solid], coords_3d)
+
+        geometry = gpd.GeoSeries(
+            geoms, index=gdf.index, crs=target_crs, name=gdf.geometry.name
+        )
+        return gdf.set_geometry(geometry)
+
+    @classmethod
+    def _remember(cls, cache_path: Path, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Keep a loaded dataset in memory for later calls in this process.
+        
+        Args:
+            cache_path: Cache file of the dataset, used as its key
+            gdf: Loaded GeoDataFrame in the target CRS
+            
+        Returns:
+            gpd.GeoDataFrame: A copy of gdf, so callers cannot modify the stored data
+        """
+        cls._loaded[cache_path] = gdf
+        return gdf.copy()
+
+    @classmethod
+    def _limit_rows(cls, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Apply the MAX_ROWS development limit, if set.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            
+        Returns:
+            gpd.GeoDataFrame: At most MAX_ROWS rows of gdf
+        """
+        if cls.MAX_ROWS is None:
+            return gdf
+        return gdf.iloc[:cls.MAX_ROWS]
+
+    @classmethod
+    def _clip_to_bbox(cls, gdf: gpd.GeoDataFrame, bbox: Optional[BBox]) -> gpd.GeoDataFrame:
+        """
+        Select the features whose bounds intersect a bounding box.
+        
+        Args:
+            gdf: Input GeoDataFrame
+            bbox: (minx, miny, maxx, maxy) in the CRS of gdf; gdf is returned as is if None
+            
+        Returns:
+            gpd.GeoDataFrame: Features intersecting bbox
+        """
+        if bbox is None:
+            return gdf
+        minx, miny, maxx, maxy = bbox
+        return gdf.cx[minx:maxx, miny:maxy]
 
     @classmethod
-    def get_districts(cls) -> gpd.GeoDataFrame:
+    def get_districts(cls, bbox: Optional[BBox] = None) -> gpd.GeoDataFrame:
         """
         Fetch land use districts data, using cached data if available and not stale.
+        Only ESSENTIAL_DISTRICT_COLS are requested from the API and read from disk.
+        When MAX_ROWS is set, only that many records are returned.
+        
+        Args:
+            bbox: Only return districts intersecting this (minx, miny, maxx, maxy)
+                box in the target CRS; all districts if None. The disk cache is
+                read with the filter pushed down, skipping the rest of the file.
         
         Returns:
             gpd.GeoDataFrame: Land use districts data in the target CRS
         """
-        # Try to load from cache first
-        cached_data = cls._load_from_cache(cls.CACHED_DISTRICTS_FILE)
+        # Reuse data already loaded by this process
+        if cls.CACHED_DISTRICTS_FILE in cls._loaded:
+            districts = cls._loaded[cls.CACHED_DISTRICTS_FILE]
+            return cls._limit_rows(cls._clip_to_bbox(districts, bbox)).copy()
+            
+        # Try to load from cache next; only the full dataset is kept in memory
+        cached_data = cls._load_from_cache(
+            cls.CACHED_DISTRICTS_FILE,
+            resource_id=cls.LAND_USE_DISTRICTS_ID,
+            columns=cls.ESSENTIAL_DISTRICT_COLS,
+            bbox=bbox,
+        )
         if cached_data is not None:
-            return cached_data
+            if bbox is not None:
+                return cls._limit_rows(cached_data)
+            return cls._limit_rows(cls._remember(cls.CACHED_DISTRICTS_FILE, cached_data))
 
-        # Fetch fresh data if cache miss
+        # Fetch fresh data if cache miss, letting the API drop unused columns
         try:
-            gdf = gpd.read_file(cls.LAND_USE_DISTRICTS_URL)
-            gdf = cls._ensure_crs(gdf)
+            select = ",".join(cls.ESSENTIAL_DISTRICT_COLS + [cls.DISTRICTS_GEOMETRY_FIELD])
+            limit = cls.MAX_ROWS if cls.MAX_ROWS is not None else cls.PAGE_SIZE
+            url = f"{cls.LAND_USE_DISTRICTS_URL}?$limit={limit}&$select={select}"
+            gdf = cls._read_url(url, columns=cls.ESSENTIAL_DISTRICT_COLS)
+            gdf = cls._sort_spatially(cls._ensure_crs(gdf))
+            if cls.MAX_ROWS is not None:
+                return cls._clip_to_bbox(gdf, bbox)
             cls._save_to_cache(gdf, cls.CACHED_DISTRICTS_FILE)
-            return gdf
+            return cls._clip_to_bbox(cls._remember(cls.CACHED_DISTRICTS_FILE, gdf), bbox)
         except Exception as e:
             logger.error(f"Error fetching land use districts: {e}")
             raise
@@ -135,46 +661,73 @@ class DataManager:
     def get_parcel_boundaries(cls) -> gpd.GeoDataFrame:
         """
         Fetch parcel boundary data, using cached data if available and not stale.
-        Handles API pagination to ensure all records are fetched.
+        Handles API pagination to ensure all records are fetched. Only
+        ESSENTIAL_PARCEL_COLS are parsed from the API and read from disk.
+        When MAX_ROWS is set, only that many records are returned.
         
         Returns:
             gpd.GeoDataFrame: Parcel boundary data in the target CRS
         """
-        # Try to load from cache first
-        cached_data = cls._load_from_cache(cls.CACHED_PARCELS_FILE)
+        # Reuse data already loaded by this process
+        if cls.CACHED_PARCELS_FILE in cls._loaded:
+            return cls._limit_rows(cls._loaded[cls.CACHED_PARCELS_FILE]).copy()
+            
+        # Try to load from cache next
+        cached_data = cls._load_from_cache(
+            cls.CACHED_PARCELS_FILE,
+            resource_id=cls.PARCEL_BOUNDARIES_ID,
+            columns=cls.ESSENTIAL_PARCEL_COLS,
+        )
         if cached_data is not None:
-            return cached_data
+            return cls._limit_rows(cls._remember(cls.CACHED_PARCELS_FILE, cached_data))
 
         # Fetch fresh data if cache miss
         try:
-            limit = 100000  # Socrata's maximum limit per request
-            offset = 0
-            all_data = []
-            
-            while True:
-                url = f"{cls.PARCEL_BOUNDARIES_URL}?$limit={limit}&$offset={offset}"
-                logger.info(f"Fetching records {offset:,} to {offset + limit:,}...")
-                
-                chunk = gpd.read_file(url)
-                if chunk.empty:
-                    break
-                    
-                all_data.append(chunk)
-                offset += limit
-                
-                if len(chunk) < limit:  # Last chunk
-                    break
-            
-            if not all_data:
+            total = cls._count_records(cls.PARCEL_BOUNDARIES_URL)
+            if cls.MAX_ROWS is not None:
+                total = min(total, cls.MAX_ROWS)
+            if total == 0:
                 raise ValueError("No parcel data fetched from API")
             
-            # Combine all chunks and ensure correct CRS
-            gdf = gpd.GeoDataFrame(pd.concat(all_data, ignore_index=True))
-            gdf = cls._ensure_crs(gdf)
+            # The record count fixes every page up front, including the
+            # shorter last one, so no request past the end is needed
+            n_pages = math.ceil(total / cls.PAGE_SIZE)
+            offsets = [page * cls.PAGE_SIZE for page in range(n_pages)]
+            limits = [min(cls.PAGE_SIZE, total - offset) for offset in offsets]
+            logger.info(f"Fetching {total:,} parcel records in {n_pages} pages...")
+            
+            # Pages are independent, so fetch them concurrently; map() keeps
+            # the results in offset order
+            with ThreadPoolExecutor(max_workers=cls.MAX_FETCH_WORKERS) as executor:
+                pages = list(executor.map(cls._fetch_parcel_page, offsets, limits))
+            tables = [table for _, table in pages if table.num_rows]
+            
+            if not tables:
+                raise ValueError("No parcel data fetched from API")
+            
+            # Concatenating Arrow tables only links their chunks, so the
+            # records are copied once, when the GeoDataFrame is built
+            table = pa.concat_tables(tables, promote_options="permissive")
+            if table.num_rows != total:
+                logger.warning(
+                    f"Expected {total:,} parcel records but fetched {table.num_rows:,}; "
+                    "the dataset may have changed during the download"
+                )
+            
+            # Dictionary-encode repeated codes while still in Arrow; pandas
+            # unifies the per-page dictionaries into a single categorical
+            for col in cls.CATEGORICAL_PARCEL_COLS:
+                if col in table.column_names:
+                    index = table.schema.get_field_index(col)
+                    table = table.set_column(index, col, pc.dictionary_encode(table[col]))
+            gdf = cls._ensure_crs(cls._table_to_geodataframe(pages[0][0], table))
+            gdf = cls._sort_spatially(gdf)
+            if cls.MAX_ROWS is not None:
+                return gdf
             
             # Cache the complete dataset
             cls._save_to_cache(gdf, cls.CACHED_PARCELS_FILE)
-            return gdf
+            return cls._remember(cls.CACHED_PARCELS_FILE, gdf)
             
         except Exception as e:
             logger.error(f"Error fetching parcel boundaries: {e}")
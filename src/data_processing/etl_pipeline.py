@@ -8,13 +8,18 @@ Calgary's zoning and parcel data. It includes functions for:
 - Loading processed data into the appropriate format for simulation
 """ 
 
+import argparse
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pyogrio
+import shapely
 import requests
 from pathlib import Path
 import matplotlib.pyplot as plt
 from .data_manager import DataManager
 import logging
+import os
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -28,6 +33,9 @@ if not logger.handlers:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
+# Row limit applied when running with CIVICA_DEV=1 and no CIVICA_MAX_ROWS
+DEV_MAX_ROWS = 1000
+
 def filter_land_use_columns(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Filter the land use districts dataset to keep only essential columns.
@@ -38,16 +46,17 @@ def filter_land_use_columns(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     Returns:
         gpd.GeoDataFrame: Filtered GeoDataFrame with only essential columns
     """
-    essential_columns = ['lu_code', 'description', 'lu_bylaw', 'geometry']
+    essential_columns = DataManager.ESSENTIAL_DISTRICT_COLS + ['geometry']
     return gdf[essential_columns]
 
-def get_land_use_data():
+def get_land_use_data(bbox=None):
     """
     Extract land use districts data from Calgary's Open Data Portal.
-    Returns a GeoPandas DataFrame containing the land use districts.
+    Returns a GeoPandas DataFrame containing the land use districts,
+    optionally limited to those intersecting bbox (minx, miny, maxx, maxy).
     """
     # Get the data using DataManager
-    districts = DataManager.get_districts()
+    districts = DataManager.get_districts(bbox=bbox)
     # Filter to keep only essential columns
     return filter_land_use_columns(districts)
 
@@ -61,8 +70,7 @@ def filter_parcel_columns(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     Returns:
         gpd.GeoDataFrame: Filtered GeoDataFrame with only essential columns
     """
-    essential_columns = ['land_size_sm', 'property_type', 'unique_key', 'comm_name', 
-                        'sub_property_use', 'address', 'geometry', 'land_use_designation']
+    essential_columns = DataManager.ESSENTIAL_PARCEL_COLS + ['geometry']
     return gdf[essential_columns]
 
 def get_parcel_data():
@@ -75,27 +83,46 @@ def get_parcel_data():
     # Filter to keep only essential columns
     return filter_parcel_columns(parcels)
 
-def save_processed_data(gdf: gpd.GeoDataFrame, filename: str):
+def save_processed_data(gdf: gpd.GeoDataFrame, filename: str, legacy_geojson: bool = False):
     """
-    Save processed GeoDataFrame to the processed data directory.
+    Save processed GeoDataFrame to the processed data directory as
+    zstd-compressed GeoParquet.
+    
+    Geometries are stored with native GeoArrow encoding so readers skip the
+    WKB decode. Frames GeoArrow cannot represent (mixed geometry types, or no
+    geometries at all) fall back to WKB.
     
     Args:
         gdf: GeoDataFrame to save
         filename: Name of the file to save (without extension)
+        legacy_geojson: Write GeoJSON instead of GeoParquet, for consumers
+            that cannot read Parquet
     """
     # Create processed data directory if it doesn't exist
     processed_dir = Path("data/processed")
     processed_dir.mkdir(parents=True, exist_ok=True)
     
     # Save the data
-    output_path = processed_dir / f"{filename}.geojson"
-    gdf.to_file(output_path, driver='GeoJSON')
+    if legacy_geojson:
+        output_path = processed_dir / f"{filename}.geojson"
+        pyogrio.write_dataframe(gdf, output_path, driver='GeoJSON', use_arrow=True)
+    else:
+        output_path = processed_dir / f"{filename}.parquet"
+        try:
+            gdf.to_parquet(output_path, compression='zstd', index=False, geometry_encoding='geoarrow')
+        except (ValueError, NotImplementedError) as e:
+            logger.warning(f"Falling back to WKB geometry encoding for {filename}: {e}")
+            gdf.to_parquet(output_path, compression='zstd', index=False)
     logger.info(f"Saved {filename} to {output_path}")
 
 def spatial_join_parcels_districts(parcels: gpd.GeoDataFrame, districts: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Perform a spatial join between parcels and districts dataframes.
     
+    Each parcel is matched against the districts containing its representative
+    point (a point guaranteed to lie inside the parcel). Parcels that fall in no
+    district are kept with empty district columns, as in a left join.
+    
     Args:
         parcels: GeoDataFrame containing parcel boundaries (left dataframe)
         districts: GeoDataFrame containing land use districts (right dataframe)
@@ -107,21 +134,44 @@ def spatial_join_parcels_districts(parcels: gpd.GeoDataFrame, districts: gpd.Geo
     if parcels.crs != districts.crs:
         districts = districts.to_crs(parcels.crs)
     
-    # Perform spatial join
-    joined_gdf = gpd.sjoin(
-        parcels,
-        districts,
-        how='left',
-        predicate='within'
-    )
+    # Query every parcel point against the district index in a single GEOS
+    # call; the index already skips districts whose envelope cannot match
+    tree = shapely.STRtree(np.asarray(districts.geometry.values))
+    points = shapely.point_on_surface(np.asarray(parcels.geometry.values))
+    parcel_idx, district_idx = tree.query(points, predicate='within')
     
-    # Drop the index_right column created by the spatial join
-    if 'index_right' in joined_gdf.columns:
-        joined_gdf = joined_gdf.drop(columns=['index_right'])
+    # Keep unmatched parcels (district position -1) and restore parcel order
+    unmatched = np.setdiff1d(np.arange(len(parcels)), parcel_idx)
+    left_pos = np.concatenate([parcel_idx, unmatched])
+    right_pos = np.concatenate([district_idx, np.full(len(unmatched), -1)])
+    order = np.argsort(left_pos, kind='stable')
+    left_pos, right_pos = left_pos[order], right_pos[order]
+    
+    # Reindexing at -1 yields an all-null row for unmatched parcels
+    district_attrs = districts.drop(columns=districts.geometry.name).reset_index(drop=True)
+    joined_gdf = parcels.iloc[left_pos].reset_index(drop=True).join(
+        district_attrs.reindex(right_pos).reset_index(drop=True),
+        lsuffix='_left',
+        rsuffix='_right'
+    )
+    joined_gdf.index = parcels.index[left_pos]
     
     return joined_gdf
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Civica ETL pipeline")
+    parser.add_argument(
+        "--legacy-geojson",
+        action="store_true",
+        help="write processed datasets as GeoJSON instead of GeoParquet"
+    )
+    args = parser.parse_args()
+    
+    if os.environ.get("CIVICA_DEV") == "1" and DataManager.MAX_ROWS is None:
+        DataManager.MAX_ROWS = DEV_MAX_ROWS
+    if DataManager.MAX_ROWS is not None:
+        logger.info(f"Development run: limited to {DataManager.MAX_ROWS:,} rows per dataset")
+    
     try:
         # Get the land use data
         districts = get_land_use_data()
@@ -142,15 +192,15 @@ if __name__ == "__main__":
             logger.info(f"Both datasets using CRS: {districts.crs}")
         
         # Save processed datasets
-        save_processed_data(districts, "land_use_districts")
-        save_processed_data(parcels, "parcel_boundaries")
+        save_processed_data(districts, "land_use_districts", legacy_geojson=args.legacy_geojson)
+        save_processed_data(parcels, "parcel_boundaries", legacy_geojson=args.legacy_geojson)
         
         # Perform spatial join
         joined_data = spatial_join_parcels_districts(parcels, districts)
         logger.info(f"Created spatial join with {len(joined_data)} rows")
         
         # Save joined dataset
-        save_processed_data(joined_data, "parcels_with_districts")
+        save_processed_data(joined_data, "parcels_with_districts", legacy_geojson=args.legacy_geojson)
         
         logger.info("Data processing completed successfully!")
         
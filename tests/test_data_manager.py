@@ -0,0 +1,248 @@
+"""
+Tests for the DataManager caching and coordinate handling.
+"""
+
+import datetime
+import json
+import os
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import pyogrio
+import pytest
+from shapely.geometry import Point, Polygon
+
+from src.data_processing.data_manager import DataManager, _max_rows_from_env
+
+LONG_AGO = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+FEATURES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"lu_code": "R-C1", "description": "Residential", "lu_bylaw": "1P2007"},
+            "geometry": {"type": "Point", "coordinates": [-114, 51]},
+        },
+        {
+            "type": "Feature",
+            "properties": {"lu_code": "C-COR1", "description": "Commercial", "lu_bylaw": "1P2007"},
+            "geometry": {"type": "Point", "coordinates": [-113.9, 51.1]},
+        },
+    ],
+}
+
+
+def test_ensure_crs_keeps_2d_geometries_next_to_3d_ones():
+    """Mixing 2D and 3D geometries must not turn the 2D coordinates into NaN."""
+    gdf = gpd.GeoDataFrame(
+        geometry=[
+            Point(-114, 51),
+            Point(-114, 51, 10),
+            None,
+            Polygon([(-114, 51), (-113.9, 51), (-113.9, 51.1)]),
+        ],
+        crs=DataManager.SOURCE_CRS,
+    )
+    expected = gdf.to_crs(DataManager.TARGET_CRS)
+
+    result = DataManager._ensure_crs(gdf.copy())
+
+    assert result.crs.equals(expected.crs)
+    assert result.geometry.has_z.tolist() == expected.geometry.has_z.tolist()
+    assert result.geometry.geom_equals_exact(expected.geometry, tolerance=1e-6).tolist() == [
+        True, True, False, True
+    ]
+    assert result.geometry.iloc[2] is None
+    assert result.geometry.iloc[1].z == pytest.approx(10)
+
+
+def test_table_to_geodataframe_does_not_need_geoarrow_tag():
+    """The geometry is found from the read_arrow metadata, not the field tag."""
+    meta, table = pyogrio.read_arrow(json.dumps(FEATURES).encode())
+    geometry_name = meta["geometry_name"] or "wkb_geometry"
+    index = table.schema.get_field_index(geometry_name)
+    untagged = table.set_column(index, pa.field(geometry_name, pa.binary()), table[geometry_name])
+
+    gdf = DataManager._table_to_geodataframe(meta, untagged)
+
+    assert gdf.geometry.name == "geometry"
+    assert gdf.crs.equals(meta["crs"])
+    assert gdf["lu_code"].tolist() == ["R-C1", "C-COR1"]
+    expected = gpd.GeoSeries([Point(-114, 51), Point(-113.9, 51.1)], crs=gdf.crs)
+    assert gdf.geometry.geom_equals(expected).all()
+
+
+def test_parallel_reprojection_matches_serial(monkeypatch):
+    """Chunked reprojection on the shared pool gives the serial result."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-114.3, -113.8, 5000)
+    y = rng.uniform(50.8, 51.3, 5000)
+    transformer = DataManager._get_transformer(DataManager._parse_crs(DataManager.SOURCE_CRS))
+    expected = transformer.transform(x, y)
+
+    monkeypatch.setattr(DataManager, "REPROJECT_WORKERS", 4)
+    monkeypatch.setattr(DataManager, "REPROJECT_CHUNK_SIZE", 1000)
+    for _ in range(2):
+        axes = [x.copy(), y.copy()]
+        DataManager._transform_in_place(transformer, axes)
+        np.testing.assert_allclose(axes, expected)
+
+
+def parcel_features(n):
+    """GeoJSON parcels on a grid, listed so that :id order is not spatial."""
+    features = []
+    for i in range(n):
+        col, row = (i * 7) % n, i
+        x, y = -114.2 + col * 0.001, 50.9 + row * 0.001
+        properties = {name: f"{name}-{i % 3}" for name in DataManager.ESSENTIAL_PARCEL_COLS}
+        properties["unique_key"] = str(i)
+        features.append({
+            "type": "Feature",
+            "properties": properties,
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[
+                    [x, y], [x + 0.0005, y], [x + 0.0005, y + 0.0005], [x, y + 0.0005], [x, y]
+                ]],
+            },
+        })
+    return features
+
+
+@pytest.fixture
+def portal(tmp_path, monkeypatch):
+    """Point the DataManager at a tmp_path cache and an in-memory portal."""
+    monkeypatch.setattr(DataManager, "CACHED_DISTRICTS_FILE", tmp_path / "land_use_districts.parquet")
+    monkeypatch.setattr(DataManager, "CACHED_PARCELS_FILE", tmp_path / "parcel_boundaries.parquet")
+    monkeypatch.setattr(DataManager, "_loaded", {})
+    monkeypatch.setattr(DataManager, "_portal_updates", {})
+    monkeypatch.setattr(DataManager, "MAX_ROWS", None)
+    monkeypatch.setattr(DataManager, "PAGE_SIZE", 4)
+
+    state = {"parcels": parcel_features(10), "downloads": 0, "last_update": LONG_AGO}
+
+    def download(url):
+        state["downloads"] += 1
+        query = parse_qs(urlsplit(url).query)
+        if url.startswith(DataManager.PARCEL_BOUNDARIES_URL):
+            offset = int(query["$offset"][0])
+            features = state["parcels"][offset:offset + int(query["$limit"][0])]
+        else:
+            features = FEATURES["features"][:int(query["$limit"][0])]
+        return json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+    monkeypatch.setattr(DataManager, "_download", classmethod(lambda cls, url: download(url)))
+    monkeypatch.setattr(
+        DataManager, "_count_records", classmethod(lambda cls, url: len(state["parcels"]))
+    )
+    monkeypatch.setattr(
+        DataManager, "_portal_last_update",
+        classmethod(lambda cls, resource_id: state["last_update"]),
+    )
+    return state
+
+
+def test_parcels_have_the_same_order_with_and_without_cache(portal):
+    """A cache miss returns rows in the order a later cache hit reads them."""
+    fetched = DataManager.get_parcel_boundaries()
+    DataManager._loaded.clear()
+    cached = DataManager.get_parcel_boundaries()
+
+    assert portal["downloads"] == 3
+    assert fetched["unique_key"].tolist() != [str(i) for i in range(10)]
+    assert fetched["unique_key"].tolist() == cached["unique_key"].tolist()
+    assert fetched.index.equals(cached.index)
+
+
+def test_cache_is_reused_until_the_portal_updates(portal):
+    DataManager.get_districts()
+    DataManager._loaded.clear()
+    DataManager.get_districts()
+    assert portal["downloads"] == 1
+
+    portal["last_update"] = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+    DataManager._loaded.clear()
+    DataManager.get_districts()
+    assert portal["downloads"] == 2
+
+
+def test_cache_expires_by_age_when_the_portal_is_unreachable(portal, monkeypatch):
+    def unreachable(cls, resource_id):
+        raise ConnectionError("portal down")
+
+    monkeypatch.setattr(DataManager, "_portal_last_update", classmethod(unreachable))
+    DataManager.get_districts()
+    cache_path = DataManager.CACHED_DISTRICTS_FILE
+    assert DataManager._is_cache_valid(cache_path, DataManager.LAND_USE_DISTRICTS_ID)
+
+    expired = time.time() - (DataManager.CACHE_EXPIRY_DAYS + 1) * 86400
+    os.utime(cache_path, (expired, expired))
+    assert not DataManager._is_cache_valid(cache_path, DataManager.LAND_USE_DISTRICTS_ID)
+
+
+def test_legacy_geojson_cache_is_migrated_with_its_mtime(portal):
+    legacy_path = DataManager.CACHED_DISTRICTS_FILE.with_suffix(DataManager.LEGACY_CACHE_SUFFIX)
+    gpd.read_file(json.dumps(FEATURES)).to_file(legacy_path, driver="GeoJSON")
+    mtime = time.time() - 3600
+    os.utime(legacy_path, (mtime, mtime))
+
+    districts = DataManager.get_districts()
+
+    assert portal["downloads"] == 0
+    assert not legacy_path.exists()
+    assert DataManager.CACHED_DISTRICTS_FILE.stat().st_mtime == pytest.approx(mtime)
+    assert sorted(districts["lu_code"]) == ["C-COR1", "R-C1"]
+    assert districts.crs.equals(DataManager.TARGET_CRS)
+
+
+def test_loaded_data_is_returned_as_copies(portal):
+    first = DataManager.get_parcel_boundaries()
+    first["unique_key"] = "changed"
+    first.drop(first.index[:5], inplace=True)
+
+    second = DataManager.get_parcel_boundaries()
+
+    assert portal["downloads"] == 3
+    assert len(second) == 10
+    assert "changed" not in second["unique_key"].tolist()
+
+
+def test_limited_rows_are_never_cached(portal, monkeypatch):
+    monkeypatch.setattr(DataManager, "MAX_ROWS", 2)
+
+    parcels = DataManager.get_parcel_boundaries()
+    districts = DataManager.get_districts()
+
+    assert len(parcels) == 2
+    assert len(districts) == 2
+    assert not DataManager.CACHED_PARCELS_FILE.exists()
+    assert not DataManager.CACHED_DISTRICTS_FILE.exists()
+    assert DataManager._loaded == {}
+
+    monkeypatch.setattr(DataManager, "MAX_ROWS", None)
+    assert len(DataManager.get_parcel_boundaries()) == 10
+
+
+@pytest.mark.parametrize("value, expected", [("", None), ("1", 1), ("250", 250)])
+def test_max_rows_env_var(value, expected, monkeypatch):
+    monkeypatch.setenv("CIVICA_MAX_ROWS", value)
+    assert _max_rows_from_env() == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "ten", "1.5"])
+def test_max_rows_env_var_must_be_positive(value, monkeypatch):
+    monkeypatch.setenv("CIVICA_MAX_ROWS", value)
+    with pytest.raises(ValueError, match="CIVICA_MAX_ROWS must be a positive integer"):
+        _max_rows_from_env()
+
+
+def test_max_rows_limits_the_district_request(portal, monkeypatch):
+    monkeypatch.setattr(DataManager, "MAX_ROWS", 1)
+
+    districts = DataManager.get_districts()
+
+    assert districts["lu_code"].tolist() == ["R-C1"]
@@ -0,0 +1,174 @@
+"""
+Tests for the ETL pipeline spatial join and output.
+"""
+
+import json
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from shapely.geometry import Point, box
+
+from src.data_processing.etl_pipeline import save_processed_data, spatial_join_parcels_districts
+
+CRS = "EPSG:3400"
+
+
+@pytest.fixture
+def districts():
+    """Two overlapping districts and one separate one, sharing a 'name' column with parcels."""
+    return gpd.GeoDataFrame(
+        {
+            "lu_code": ["R-C1", "M-C2", "C-COR1"],
+            "name": ["west", "east", "far"],
+        },
+        geometry=[box(0, 0, 10, 10), box(5, 0, 15, 10), box(20, 0, 30, 10)],
+        index=[10, 20, 30],
+        crs=CRS,
+    )
+
+
+@pytest.fixture
+def parcels():
+    """Parcels in one district, in two overlapping districts and in none, keyed by string ids."""
+    return gpd.GeoDataFrame(
+        {
+            "unique_key": ["a", "b", "c", "d"],
+            "name": ["first", "second", "third", "fourth"],
+        },
+        geometry=[box(1, 1, 2, 2), box(6, 1, 7, 2), box(40, 40, 41, 41), box(21, 1, 22, 2)],
+        index=pd.Index(["p1", "p2", "p3", "p4"], name="parcel_id"),
+        crs=CRS,
+    )
+
+
+def reference_join(parcels, districts):
+    """gpd.sjoin of the parcels' representative points, with the parcel geometry restored."""
+    points = parcels.set_geometry(parcels.geometry.representative_point())
+    joined = gpd.sjoin(points, districts, how="left", predicate="within")
+    joined = joined.drop(columns="index_right")
+    return joined.set_geometry(parcels.geometry.reindex(joined.index))
+
+
+def sort_rows(gdf):
+    """Order rows by parcel, then district, without depending on match order."""
+    ordered = gdf.reset_index().sort_values(["unique_key", "lu_code"], kind="stable")
+    return ordered.reset_index(drop=True)
+
+
+def test_join_matches_sjoin_on_representative_points(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts)
+    expected = reference_join(parcels, districts)
+
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(sort_rows(result), sort_rows(expected))
+
+
+def test_join_keeps_unmatched_parcels(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts)
+
+    unmatched = result.loc[["p3"]]
+    assert len(unmatched) == 1
+    assert unmatched[["lu_code", "name_right"]].isna().all(axis=None)
+    assert unmatched.geometry.iloc[0].equals(parcels.geometry["p3"])
+
+
+def test_join_repeats_parcels_in_overlapping_districts(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts)
+
+    assert sorted(result.loc["p2", "lu_code"]) == ["M-C2", "R-C1"]
+    assert len(result) == len(parcels) + 1
+
+
+def test_join_keeps_parcel_index_and_order(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts)
+
+    assert result.index.name == "parcel_id"
+    assert list(result.index) == ["p1", "p2", "p2", "p3", "p4"]
+    assert list(result["unique_key"]) == ["a", "b", "b", "c", "d"]
+
+
+def test_join_suffixes_clashing_columns(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts)
+
+    assert "name" not in result.columns
+    assert result.loc["p1", "name_left"] == "first"
+    assert result.loc["p1", "name_right"] == "west"
+
+
+def test_join_reprojects_districts_to_parcel_crs(parcels, districts):
+    result = spatial_join_parcels_districts(parcels, districts.to_crs("EPSG:4326"))
+
+    assert result.crs == parcels.crs
+    assert result.loc["p4", "lu_code"] == "C-COR1"
+
+
+def test_join_of_empty_parcels_is_empty(parcels, districts):
+    empty = parcels.iloc[:0]
+
+    result = spatial_join_parcels_districts(empty, districts)
+    expected = reference_join(empty, districts)
+
+    assert result.empty
+    assert list(result.columns) == list(expected.columns)
+
+
+def test_join_of_parcels_without_geometry_keeps_them_unmatched(parcels, districts):
+    missing = parcels.set_geometry(gpd.GeoSeries([None] * len(parcels), index=parcels.index, crs=CRS))
+
+    result = spatial_join_parcels_districts(missing, districts)
+
+    assert list(result.index) == list(parcels.index)
+    assert result["lu_code"].isna().all()
+
+
+@pytest.fixture
+def processed_dir(tmp_path, monkeypatch):
+    """Run save_processed_data inside tmp_path, which holds the data/processed output."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data" / "processed"
+
+
+def test_save_writes_geoarrow_parquet(parcels, processed_dir):
+    save_processed_data(parcels, "parcels")
+
+    path = processed_dir / "parcels.parquet"
+    geo_metadata = json.loads(pq.read_schema(path).metadata[b"geo"])
+    assert geo_metadata["columns"]["geometry"]["encoding"] == "polygon"
+    saved = gpd.read_parquet(path)
+    assert saved["unique_key"].tolist() == parcels["unique_key"].tolist()
+    assert saved.geometry.geom_equals(parcels.geometry.reset_index(drop=True)).all()
+
+
+def test_save_falls_back_to_wkb_for_mixed_geometry_types(processed_dir):
+    mixed = gpd.GeoDataFrame(
+        {"unique_key": ["a", "b"]}, geometry=[Point(0, 0), box(0, 0, 1, 1)], crs=CRS
+    )
+
+    save_processed_data(mixed, "mixed")
+
+    path = processed_dir / "mixed.parquet"
+    geo_metadata = json.loads(pq.read_schema(path).metadata[b"geo"])
+    assert geo_metadata["columns"]["geometry"]["encoding"] == "WKB"
+    assert gpd.read_parquet(path).geometry.geom_equals(mixed.geometry).all()
+
+
+@pytest.mark.parametrize("geometry", [[], [None]], ids=["empty", "all-missing"])
+def test_save_writes_frames_without_geometries(geometry, processed_dir):
+    gdf = gpd.GeoDataFrame({"unique_key": ["a"] * len(geometry)}, geometry=geometry, crs=CRS)
+
+    save_processed_data(gdf, "nothing")
+
+    saved = gpd.read_parquet(processed_dir / "nothing.parquet")
+    assert len(saved) == len(gdf)
+    assert saved.geometry.isna().all()
+
+
+def test_save_writes_legacy_geojson(parcels, processed_dir):
+    save_processed_data(parcels, "parcels", legacy_geojson=True)
+
+    assert not (processed_dir / "parcels.parquet").exists()
+    saved = gpd.read_file(processed_dir / "parcels.geojson")
+    assert saved["unique_key"].tolist() == parcels["unique_key"].tolist()
+    assert saved.crs.equals(parcels.crs)